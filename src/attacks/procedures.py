@@ -46,17 +46,13 @@ class BatchIterativeAttack:
         self.metrics = pd.concat([self.metrics, df_line])
 
     def get_model_predictions(self, loader: DataLoader) -> torch.Tensor:
-        y_pred_all_objects = torch.tensor(
-            []
-        )
+        y_pred_batches = []
         with torch.no_grad():
             for X, y_true in loader:
                 X, y_true = self.prepare_data_to_attack(X, y_true)
                 y_pred = self.model(X)
-                y_pred_all_objects = torch.cat(
-                    (y_pred_all_objects, y_pred.cpu().detach()), dim=0
-                )
-        return y_pred_all_objects
+                y_pred_batches.append(y_pred.cpu().detach())
+        return torch.cat(y_pred_batches, dim=0)
 
     def prepare_data_to_attack(
         self, X: torch.Tensor, y: torch.Tensor
@@ -69,53 +65,37 @@ class BatchIterativeAttack:
         return X, y
 
     def run_iteration_log(self, loader: DataLoader) -> Tuple[torch.Tensor]:
-        X_adv_all_objects = torch.FloatTensor(
-            []
-        )  # logging x_adv for rebuilding dataloader
-        y_true_all_objects = torch.tensor(
-            []
-        )  # logging model for rebuilding dataloader and calculation difference with preds
-        y_pred_all_objects = torch.tensor(
-            []
-        )  # logging predictions adversarial if realize_attack or original
+        X_adv_batches = []  # logging x_adv for rebuilding dataloader
+        y_true_batches = []  # logging model for rebuilding dataloader and calculation difference with preds
+        y_pred_batches = []  # logging predictions adversarial if realize_attack or original
 
         for X, y_true in loader:
             X, y_true = self.prepare_data_to_attack(X, y_true)
             X_adv = self.step(X, y_true)
             y_pred_adv = self.model(X_adv)
 
-            X_adv_all_objects = torch.cat(
-                (X_adv_all_objects, X_adv.cpu().detach()), dim=0
-            )
-            y_true_all_objects = torch.cat(
-                (y_true_all_objects, y_true.cpu().detach()), dim=0
-            )
-            y_pred_all_objects = torch.cat(
-                (y_pred_all_objects, y_pred_adv.cpu().detach()), dim=0
-            )
+            X_adv_batches.append(X_adv.cpu().detach())
+            y_true_batches.append(y_true.cpu().detach())
+            y_pred_batches.append(y_pred_adv.cpu().detach())
 
-        return X_adv_all_objects, y_true_all_objects, y_pred_all_objects
+        return (
+            torch.cat(X_adv_batches, dim=0),
+            torch.cat(y_true_batches, dim=0),
+            torch.cat(y_pred_batches, dim=0),
+        )
 
     def run_iteration(self, loader: DataLoader) -> Tuple[torch.Tensor]:
-        X_adv_all_objects = torch.FloatTensor(
-            []
-        )  # logging x_adv for rebuilding dataloader
-        y_true_all_objects = torch.tensor(
-            []
-        )  # logging model for rebuilding dataloader and calculation difference with preds
+        X_adv_batches = []  # logging x_adv for rebuilding dataloader
+        y_true_batches = []  # logging model for rebuilding dataloader and calculation difference with preds
 
         for X, y_true in loader:
             X, y_true = self.prepare_data_to_attack(X, y_true)
             X_adv = self.step(X, y_true)
 
-            X_adv_all_objects = torch.cat(
-                (X_adv_all_objects, X_adv.cpu().detach()), dim=0
-            )
-            y_true_all_objects = torch.cat(
-                (y_true_all_objects, y_true.cpu().detach()), dim=0
-            )
+            X_adv_batches.append(X_adv.cpu().detach())
+            y_true_batches.append(y_true.cpu().detach())
 
-        return X_adv_all_objects, y_true_all_objects
+        return torch.cat(X_adv_batches, dim=0), torch.cat(y_true_batches, dim=0)
 
     @staticmethod
     def rebuild_loader(loader, X_adv: torch.Tensor, y_true: torch.Tensor) -> DataLoader:
@@ -200,17 +180,13 @@ class PGDBatchIterativeAttack:
         self.metrics = pd.concat([self.metrics, df_line])
 
     def get_model_predictions(self, loader: DataLoader) -> torch.Tensor:
-        y_pred_all_objects = torch.tensor(
-            []
-        )
+        y_pred_batches = []
         with torch.no_grad():
             for X, y_true in loader:
                 X, y_true = self.prepare_data_to_attack(X, y_true)
                 y_pred = self.model(X)
-                y_pred_all_objects = torch.cat(
-                    (y_pred_all_objects, y_pred.cpu().detach()), dim=0
-                )
-        return y_pred_all_objects
+                y_pred_batches.append(y_pred.cpu().detach())
+        return torch.cat(y_pred_batches, dim=0)
 
     def prepare_data_to_attack(
         self, X: torch.Tensor, y: torch.Tensor
@@ -223,15 +199,9 @@ class PGDBatchIterativeAttack:
         return X, y
 
     def run_iteration_log(self, loader: DataLoader, loader_orig: DataLoader) -> Tuple[torch.Tensor]:
-        X_adv_all_objects = torch.FloatTensor(
-            []
-        )  # logging x_adv for rebuilding dataloader
-        y_true_all_objects = torch.tensor(
-            []
-        )  # logging model for rebuilding dataloader and calculation difference with preds
-        y_pred_all_objects = torch.tensor(
-            []
-        )  # logging predictions adversarial if realize_attack or original
+        X_adv_batches = []  # logging x_adv for rebuilding dataloader
+        y_true_batches = []  # logging model for rebuilding dataloader and calculation difference with preds
+        y_pred_batches = []  # logging predictions adversarial if realize_attack or original
 
         for (X_orig, _), (X, y_true) in zip(loader_orig, loader):
             X_orig = X_orig.to(self.device)
@@ -240,38 +210,28 @@ class PGDBatchIterativeAttack:
             X_adv = self.step(X, y_true, X_orig)
             y_pred_adv = self.model(X_adv)
 
-            X_adv_all_objects = torch.cat(
-                (X_adv_all_objects, X_adv.cpu().detach()), dim=0
-            )
-            y_true_all_objects = torch.cat(
-                (y_true_all_objects, y_true.cpu().detach()), dim=0
-            )
-            y_pred_all_objects = torch.cat(
-                (y_pred_all_objects, y_pred_adv.cpu().detach()), dim=0
-            )
+            X_adv_batches.append(X_adv.cpu().detach())
+            y_true_batches.append(y_true.cpu().detach())
+            y_pred_batches.append(y_pred_adv.cpu().detach())
 
-        return X_adv_all_objects, y_true_all_objects, y_pred_all_objects
+        return (
+            torch.cat(X_adv_batches, dim=0),
+            torch.cat(y_true_batches, dim=0),
+            torch.cat(y_pred_batches, dim=0),
+        )
 
     def run_iteration(self, loader: DataLoader, loader_orig: DataLoader) -> Tuple[torch.Tensor]:
-        X_adv_all_objects = torch.FloatTensor(
-            []
-        )  # logging x_adv for rebuilding dataloader
-        y_true_all_objects = torch.tensor(
-            []
-        )  # logging model for rebuilding dataloader and calculation difference with preds
+        X_adv_batches = []  # logging x_adv for rebuilding dataloader
+        y_true_batches = []  # logging model for rebuilding dataloader and calculation difference with preds
 
         for X_orig, _, X, y_true in zip(loader_orig, loader):
             X, y_true = self.prepare_data_to_attack(X, y_true)
             X_adv = self.step(X, y_true, X_orig)
 
-            X_adv_all_objects = torch.cat(
-                (X_adv_all_objects, X_adv.cpu().detach()), dim=0
-            )
-            y_true_all_objects = torch.cat(
-                (y_true_all_objects, y_true.cpu().detach()), dim=0
-            )
+            X_adv_batches.append(X_adv.cpu().detach())
+            y_true_batches.append(y_true.cpu().detach())
 
-        return X_adv_all_objects, y_true_all_objects
+        return torch.cat(X_adv_batches, dim=0), torch.cat(y_true_batches, dim=0)
 
     @staticmethod
     def rebuild_loader(loader, X_adv: torch.Tensor, y_true: torch.Tensor) -> DataLoader:
@@ -205,14 +205,16 @@ class OnlyXDataset(Dataset):
         transform: Callable = None,
     ) -> None:
         super().__init__()
-        self.X = X
+        # cast once here so __getitem__ only indexes instead of building a
+        # new tensor per sample
+        self.X = torch.as_tensor(X, dtype=torch.float32)
         self.transform = transform
 
     def __len__(self) -> int:
         return len(self.X)
 
     def __getitem__(self, idx: Any) -> Tuple[torch.Tensor]:
-        X = torch.tensor(self.X[idx], dtype=torch.float32)
+        X = self.X[idx]
         if self.transform:
             X = self.transform(X)
         return X
@@ -227,8 +229,10 @@ class MyDataset(Dataset):
         transform: Callable = None,
     ) -> None:
         super().__init__()
-        self.X = X
-        self.y = y
+        # cast in bulk at construction; per-sample torch.tensor calls copied
+        # (and warned on) every access
+        self.X = torch.as_tensor(X, dtype=torch.float32)
+        self.y = torch.as_tensor(y, dtype=torch.float32)
         self.window = window
         self.transform = transform
 
@@ -236,10 +240,8 @@ class MyDataset(Dataset):
         return len(self.y)
 
     def __getitem__(self, idx: Any) -> Tuple[torch.Tensor]:
-        X = torch.tensor(self.X[idx], dtype=torch.float32)
-
-        X = X.reshape([-1, 1])
-        y = torch.tensor(self.y[idx], dtype=torch.float32)
+        X = self.X[idx].reshape([-1, 1])
+        y = self.y[idx]
 
         if self.transform:
             X = self.transform(X)
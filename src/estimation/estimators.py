@@ -45,6 +45,10 @@ class ClassifierEstimator(BaseEstimator):
     def balance(y):
         return np.mean(y).item()
 
+    @staticmethod
+    def _safe_div(num: float, denom: float) -> float:
+        return float(num) / float(denom) if denom > 0 else 0.0
+
     @staticmethod
     def uncertainty(y_pred_probs: np.ndarray) -> float:
         prob_1 = y_pred_probs
@@ -67,6 +71,33 @@ class ClassifierEstimator(BaseEstimator):
         metrics_res.append(self.uncertainty(y_pred_probs))
         return metrics_res
 
+    def estimate_from_cm(self, cm: np.ndarray, certainty: float) -> List[float]:
+        """Compute the same metrics as `estimate` from a binary 2x2 confusion
+        matrix (rows: true class, columns: predicted class).
+
+        The sklearn metrics are evaluated on hard class predictions, so they
+        all reduce to closed forms over the matrix counts; certainty is the
+        only probability-based metric and is passed in precomputed.
+        """
+        tn, fp, fn, tp = cm.ravel()
+        total = cm.sum()
+
+        tpr = self._safe_div(tp, tp + fn)
+        tnr = self._safe_div(tn, tn + fp)
+        precision_1 = self._safe_div(tp, tp + fp)
+        prevalence = self._safe_div(tp + fn, total)
+
+        metrics_res = [
+            self._safe_div(tp + tn, total),              # accuracy
+            (tpr + tnr) / 2,                             # roc_auc on hard preds
+            tpr * precision_1 + (1 - tpr) * prevalence,  # avg precision on hard preds
+            self._safe_div(2 * tp, 2 * tp + fp + fn),    # f1
+            prevalence,                                  # balance_true
+            self._safe_div(tp + fp, total),              # balance_pred
+            certainty,
+        ]
+        return metrics_res
+
 
 class AttackEstimator(BaseEstimator):
     def __init__(
@@ -120,16 +151,15 @@ class AttackEstimator(BaseEstimator):
     def calculate_hid_one_model(
         self, X: torch.Tensor, disc_model: torch.nn.Module
     ) -> torch.Tensor:
-        device = next(disc_model.parameters()).device
         if self.batch_size:
             loader = DataLoader(
                 OnlyXDataset(X), batch_size=self.batch_size, shuffle=False
             )
-            y_all_preds = torch.tensor([], device=device)
+            y_pred_batches = []
             for X_batch in loader:
                 y_pred = disc_model(X_batch)
-                y_all_preds = torch.concat([y_all_preds, y_pred], axis=0)
-            return y_all_preds
+                y_pred_batches.append(y_pred)
+            return torch.concat(y_pred_batches, axis=0)
         else:
             y_pred = disc_model(X)
             return y_pred
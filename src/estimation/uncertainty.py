@@ -409,6 +409,59 @@ def build_custom_dict_curve(
     return dict_curves
 
 
+def _parse_curve_key(key: str):
+    for cast in (int, float):
+        try:
+            return cast(key)
+        except ValueError:
+            continue
+    return key
+
+
+def save_rejection_curves(rej_curves_dict: dict, path: str) -> None:
+    """Serialize a nested dict of rejection-curve arrays to a compressed npz.
+
+    Nested keys are flattened into '/'-joined archive names; compressing the
+    dense float arrays directly is faster and yields much smaller files than
+    pickling the whole dict.
+
+    :param rej_curves_dict: nested dict whose leaves are array-likes
+    :param path: output file path (numpy appends .npz if missing)
+    """
+
+    def flatten(node, prefix):
+        flat = {}
+        for key, value in node.items():
+            name = prefix + str(key)
+            if isinstance(value, dict):
+                flat.update(flatten(value, name + "/"))
+            else:
+                flat[name] = np.asarray(value)
+        return flat
+
+    np.savez_compressed(path, **flatten(rej_curves_dict, ""))
+
+
+def load_rejection_curves(path: str) -> dict:
+    """Load a nested rejection-curve dict saved by `save_rejection_curves`.
+
+    Numeric key segments are restored to int/float so lookups like
+    ``rej_curves_dict[eps][type_][iter_]`` keep working.
+
+    :param path: path to the npz file
+    :return: nested dict of numpy arrays
+    """
+    rej_curves_dict = dict()
+    with np.load(path) as data:
+        for name in data.files:
+            node = rej_curves_dict
+            *branches, leaf = [_parse_curve_key(part) for part in name.split("/")]
+            for branch in branches:
+                node = node.setdefault(branch, dict())
+            node[leaf] = data[name]
+    return rej_curves_dict
+
+
 def draw_rejection_curves(dict_curves, rejection_rates, fig_size=(17, 9)):
     plt.figure(figsize=fig_size)
 
@@ -20,6 +20,7 @@ class TS2VEC(BaseSelfSupervisedModel):
         dropout_ts2vec: float = 0.0,
         device: str = "cpu",
         activation_type: str = "sigmoid",
+        gradient_checkpointing: bool = False,
     ) -> None:
         super().__init__()
 
@@ -34,6 +35,7 @@ class TS2VEC(BaseSelfSupervisedModel):
             device=device,
             output_dims=emb_size,
             batch_size=emb_batch_size,
+            gradient_checkpointing=gradient_checkpointing,
         )
 
         self.emd_model = self.ts2vec.net
@@ -1,6 +1,7 @@
 import numpy as np
 import torch
 from torch import nn
+from torch.utils.checkpoint import checkpoint_sequential
 
 from .dilated_conv import DilatedConvEncoder
 
@@ -35,12 +36,14 @@ class TSEncoder(nn.Module):
         depth=10,
         mask_mode="binomial",
         dropout=0.1,
+        gradient_checkpointing=False,
     ):
         super().__init__()
         self.input_dims = input_dims
         self.output_dims = output_dims
         self.hidden_dims = hidden_dims
         self.mask_mode = mask_mode
+        self.gradient_checkpointing = gradient_checkpointing
         self.input_fc = nn.Linear(input_dims, hidden_dims)
         self.feature_extractor = DilatedConvEncoder(
             hidden_dims, [hidden_dims] * depth + [output_dims], kernel_size=3
@@ -76,7 +79,15 @@ class TSEncoder(nn.Module):
 
         # conv encoder
         x = x.transpose(1, 2)  # B x Ch x T
-        x = self.repr_dropout(self.feature_extractor(x))  # B x Co x T
+        if self.gradient_checkpointing and self.training:
+            # sqrt(N) segments trade ~one extra forward pass for not keeping
+            # every conv block's activations alive during backward
+            blocks = self.feature_extractor.net
+            segments = max(1, int(len(blocks) ** 0.5))
+            x = checkpoint_sequential(blocks, segments, x, use_reentrant=False)
+        else:
+            x = self.feature_extractor(x)
+        x = self.repr_dropout(x)  # B x Co x T
         x = x.transpose(1, 2)  # B x T x Co
 
         return x
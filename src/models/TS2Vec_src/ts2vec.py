@@ -30,6 +30,7 @@ class TS2Vec:
         temporal_unit=0,
         after_iter_callback=None,
         after_epoch_callback=None,
+        gradient_checkpointing=False,
     ):
         """Initialize a TS2Vec model.
 
@@ -45,6 +46,7 @@ class TS2Vec:
             temporal_unit (int): The minimum unit to perform temporal contrast. When training on a very long sequence, this param helps to reduce the cost of time and memory.
             after_iter_callback (Union[Callable, NoneType]): A callback function that would be called after each iteration.
             after_epoch_callback (Union[Callable, NoneType]): A callback function that would be called after each epoch.
+            gradient_checkpointing (bool): Whether to recompute encoder activations during backward to lower peak memory.
         """
 
         super().__init__()
@@ -60,6 +62,7 @@ class TS2Vec:
             hidden_dims=hidden_dims,
             depth=depth,
             dropout=dropout,
+            gradient_checkpointing=gradient_checkpointing,
         ).to(self.device)
         self.net = torch.optim.swa_utils.AveragedModel(self._net)
         self.net.update_parameters(self._net)
@@ -1,4 +1,5 @@
 import os
+from contextlib import nullcontext
 from functools import partial
 from typing import Any, Dict, List, Tuple
 
@@ -31,6 +32,32 @@ from src.utils import (
 )
 
 
+def is_main_process() -> bool:
+    """True on rank 0 of a distributed launch, and always outside of one."""
+    if torch.distributed.is_available() and torch.distributed.is_initialized():
+        return torch.distributed.get_rank() == 0
+    return True
+
+
+def wrap_distributed(model: torch.nn.Module, device: str) -> torch.nn.Module:
+    """Wrap the model in DistributedDataParallel when a process group is up.
+
+    DDP is preferred over DataParallel, which replays the forward through a
+    single GIL-bound process. No-op outside of torchrun/distributed launches.
+
+    Note: gradient syncing is all this gives so far — the loaders built in
+    this repo do not use a DistributedSampler yet, so every rank still sees
+    the full dataset and there is no per-epoch speedup until that lands.
+    """
+    if not (torch.distributed.is_available() and torch.distributed.is_initialized()):
+        return model
+
+    device_ids = None
+    if torch.device(device).type == "cuda":
+        device_ids = [torch.device(device).index or torch.cuda.current_device()]
+    return torch.nn.parallel.DistributedDataParallel(model, device_ids=device_ids)
+
+
 class EarlyStopper:
     def __init__(
         self,
@@ -67,18 +94,32 @@ class Trainer:
         device: str = "cpu",
         multiclass: bool = False,
         train_self_supervised: bool = True,
+        compile_model: bool = False,
+        use_amp: bool = False,
+        bf16: bool = False,
     ) -> None:
+        if compile_model and torch.cuda.is_available():
+            # keep optimizer/criterion outside the compiled region to avoid
+            # graph breaks on zero_grad/step
+            model = torch.compile(model, mode="default", fullgraph=False)
         self.model = model
         self.criterion = criterion
         self.optimizer = optimizer
         self.scheduler = scheduler
 
+        self.use_amp = use_amp and torch.cuda.is_available()
+        self.amp_dtype = torch.bfloat16 if bf16 else torch.float16
+        # bf16 has the same exponent range as fp32, so no loss scaling is needed
+        self.scaler = torch.cuda.amp.GradScaler(enabled=self.use_amp and not bf16)
+
         self.estimator = ClassifierEstimator()
         self.n_epochs = n_epochs
         self.early_stop_patience = early_stop_patience
 
         self.device = device
         self.multiclass = multiclass
+        # bind the class-prediction op once instead of branching per batch
+        self._pred_fn = partial(torch.argmax, dim=1) if multiclass else torch.round
         self.print_every = print_every
         self.train_self_supervised = train_self_supervised
 
@@ -87,6 +128,14 @@ class Trainer:
 
         self.disc_trainer = False
 
+    @property
+    def base_model(self) -> torch.nn.Module:
+        # unwrap torch.compile's OptimizedModule and DistributedDataParallel
+        # (in that order — compile wraps DDP here) so attribute access and
+        # state_dict keys see the plain module
+        model = getattr(self.model, "_orig_mod", self.model)
+        return getattr(model, "module", model)
+
     @staticmethod
     def initialize_with_params(
         model_name: str = "LSTM",
@@ -105,6 +154,9 @@ class Trainer:
         seed: int = 0,
         multiclass: bool = False,
         train_self_supervised: bool = True,
+        compile_model: bool = False,
+        use_amp: bool = False,
+        bf16: bool = False,
     ):
         fix_seed(seed)
         if model_params == "None" or not model_params:
@@ -117,6 +169,7 @@ class Trainer:
             scheduler_params = {}
 
         model = get_model(model_name, model_params, device=device)
+        model = wrap_distributed(model, device)
         criterion = get_criterion(criterion_name, criterion_params)
         optimizer = get_optimizer(optimizer_name, model.parameters(), optimizer_params)
         scheduler = get_scheduler(scheduler_name, optimizer, scheduler_params)
@@ -132,6 +185,9 @@ class Trainer:
             device=device,
             multiclass=multiclass,
             train_self_supervised=train_self_supervised,
+            compile_model=compile_model,
+            use_amp=use_amp,
+            bf16=bf16,
         )
 
     @staticmethod
@@ -141,10 +197,14 @@ class Trainer:
         optuna_params: Dict,
         const_params: Dict,
     ):
+        if "pruner" in optuna_params:
+            pruner = instantiate(optuna_params["pruner"])
+        else:
+            pruner = optuna.pruners.HyperbandPruner(min_resource=1, reduction_factor=3)
         study = optuna.create_study(
             direction="maximize",
             sampler=instantiate(optuna_params["sampler"]),
-            pruner=instantiate(optuna_params["pruner"]),
+            pruner=pruner,
         )
         study.optimize(
             partial(
@@ -186,11 +246,13 @@ class Trainer:
         )
 
         model = Trainer.initialize_with_params(**initial_model_parameters)
-        last_epoch_metrics = model.train_model(train_loader, valid_loader)
-        return last_epoch_metrics[optim_metric]
+        last_epoch_metrics = model.train_model(
+            train_loader, valid_loader, trial=trial, optim_metric=optim_metric
+        )
+        return last_epoch_metrics[model.metric_names.index(optim_metric)]
 
     def _init_logging(self, metric_names: List[str]) -> None:
-        self.metric_names = metric_names
+        self.metric_names = tuple(metric_names)
         self.dict_logging = {
             "train": {metric: [] for metric in self.metric_names},
             "test": {metric: [] for metric in self.metric_names},
@@ -200,15 +262,8 @@ class Trainer:
     def _logging(
         self, train_metrics: List[float], test_metrics: List[float], epoch: int
     ) -> None:
-        train_metrics = {
-            met_name: met_val
-            for met_name, met_val in zip(self.metric_names, train_metrics)
-        }
-
-        test_metrics = {
-            met_name: met_val
-            for met_name, met_val in zip(self.metric_names, test_metrics)
-        }
+        train_metrics = dict(zip(self.metric_names, train_metrics))
+        test_metrics = dict(zip(self.metric_names, test_metrics))
 
         mode = "train"
         for metric in self.dict_logging[mode].keys():
@@ -220,7 +275,7 @@ class Trainer:
             self.dict_logging[mode][metric].append(test_metrics[metric])
             self.logger.add_scalar(metric + "/" + mode, test_metrics[metric], epoch)
 
-        if epoch % self.print_every == 0:
+        if epoch % self.print_every == 0 and is_main_process():
             print_line = self.print_line.format(
                 epoch + 1,
                 round(train_metrics["loss"], 3),
@@ -233,14 +288,33 @@ class Trainer:
             )
             print(print_line)
 
+    def _train_self_supervised(self, train_loader: DataLoader) -> None:
+        print("Training self-supervised model")
+        # the embedding trainer (TS2Vec.fit) consumes numpy, so the data stays
+        # on host; contiguous() keeps the .numpy() call a zero-copy view
+        X_train = train_loader.dataset.X.unsqueeze(-1).contiguous().numpy()
+        self.base_model.train_embedding(X_train, verbose=True)
+        print("Training self-supervised part is finished")
+
+    def _report_to_trial(
+        self, trial: Trial, optim_metric: str, test_metrics_epoch: List[float], epoch: int
+    ) -> None:
+        if trial is None or optim_metric is None:
+            return
+        metric_idx = self.metric_names.index(optim_metric)
+        trial.report(test_metrics_epoch[metric_idx], epoch)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+
     def train_model(
-        self, train_loader: DataLoader, valid_loader: DataLoader
+        self,
+        train_loader: DataLoader,
+        valid_loader: DataLoader,
+        trial: Trial = None,
+        optim_metric: str = None,
     ) -> Dict[str, float]:
-        if self.model.self_supervised and self.train_self_supervised:
-            print("Training self-supervised model")
-            X_train = train_loader.dataset.X.unsqueeze(-1).numpy()
-            self.model.train_embedding(X_train, verbose=True)
-            print("Training self-supervised part is finished")
+        if self.base_model.self_supervised and self.train_self_supervised:
+            self._train_self_supervised(train_loader)
 
         if self.early_stop_patience and self.early_stop_patience != "None":
             earl_stopper = EarlyStopper(self.early_stop_patience)
@@ -252,6 +326,7 @@ class Trainer:
             test_metrics_epoch = self._run_epoch(valid_loader, mode="valid")
 
             self._logging(train_metrics_epoch, test_metrics_epoch, epoch)
+            self._report_to_trial(trial, optim_metric, test_metrics_epoch, epoch)
 
             if self.early_stop_patience and self.early_stop_patience != "None":
                 res_early_stop = earl_stopper.early_stop(test_metrics_epoch[0])
@@ -264,81 +339,121 @@ class Trainer:
         return test_metrics_epoch
 
     def _train_step(self, X: torch.Tensor, labels: torch.Tensor) -> Tuple[torch.Tensor]:
-        self.optimizer.zero_grad()
+        self.optimizer.zero_grad(set_to_none=True)
 
-        y_preds = self.model(X)
-        loss = self.criterion(y_preds, labels)
+        with torch.autocast(
+            device_type="cuda", dtype=self.amp_dtype, enabled=self.use_amp
+        ):
+            y_preds = self.model(X)
+        # BCELoss is rejected under autocast, so the criterion runs outside
+        # the region on fp32 predictions
+        loss = self.criterion(y_preds.float(), labels)
 
-        loss.backward()
-        self.optimizer.step()
+        self.scaler.scale(loss).backward()
+        self.scaler.step(self.optimizer)
+        self.scaler.update()
 
         return loss, y_preds
 
     def _valid_step(self, X: torch.Tensor, labels: torch.Tensor) -> Tuple[torch.Tensor]:
         with torch.no_grad():
-            y_preds = self.model(X)
-            loss = self.criterion(y_preds, labels)
+            with torch.autocast(
+                device_type="cuda", dtype=self.amp_dtype, enabled=self.use_amp
+            ):
+                y_preds = self.model(X)
+            loss = self.criterion(y_preds.float(), labels)
         return loss, y_preds
 
     def _run_epoch(self, loader: DataLoader, mode: str = "train") -> List[float]:
 
         if mode not in ['train', 'valid']:
             raise ValueError("mode should be train or valid")
+        n_batches = len(loader)
         losses = 0
-        y_all_pred = torch.tensor([])
-        y_all_pred_prob = torch.tensor([])
-        y_all_true = torch.tensor([])
+        cm = torch.zeros(4, dtype=torch.int64, device=self.device)
+        certainty_sum = 0
+        n_objects = 0
+        preds_list = []
+        preds_prob_list = []
+        trues_list = []
+
+        step_fn = self._train_step if mode == "train" else self._valid_step
+        # inference_mode skips autograd and view/version tracking for the whole
+        # validation pass, including the metric accumulation ops below
+        grad_ctx = torch.inference_mode() if mode == "valid" else nullcontext()
 
         self.model.train(mode=='train')
-        for X, labels in loader:
-            X = X.to(self.device)
-            labels = labels.to(self.device)
-
-            if mode == "train":
-                loss, y_preds = self._train_step(X, labels)
-            elif mode == "valid":
-                loss, y_preds = self._valid_step(X, labels)
-
-            if self.multiclass:
-                y_pred = torch.argmax(y_preds, axis=1)
-            else:
-                y_pred = torch.round(y_preds)
-
-            losses += loss
-            y_all_true = torch.cat((y_all_true, labels.cpu().detach()), dim=0)
-            y_all_pred_prob = torch.cat(
-                (y_all_pred_prob, y_preds.cpu().detach()), dim=0
-            )
-            y_all_pred = torch.cat((y_all_pred, y_pred.cpu().detach()), dim=0)
+        with grad_ctx:
+            for X, labels in loader:
+                X = X.to(self.device, non_blocking=True)
+                labels = labels.to(self.device, non_blocking=True)
+
+                loss, y_preds = step_fn(X, labels)
+
+                # accumulate on device; sync with the host once after the loop
+                losses = losses + loss.detach()
+                y_pred = self._pred_fn(y_preds)
+                if self.multiclass:
+                    trues_list.append(labels.detach())
+                    preds_prob_list.append(y_preds.detach())
+                    preds_list.append(y_pred.detach())
+                else:
+                    # binary metrics are all derivable from the 2x2 confusion
+                    # matrix, so only 4 counters cross the device boundary
+                    y_true_flat = labels.detach().reshape(-1).long()
+                    y_pred_flat = y_pred.detach().reshape(-1).long()
+                    cm = cm + torch.bincount(
+                        2 * y_true_flat + y_pred_flat, minlength=4
+                    )
 
-        mean_loss = losses.cpu().detach().numpy() / len(loader)
+                    # fp32: a half-precision running sum overflows past ~65k
+                    # samples under fp16 autocast
+                    probs = y_preds.detach().reshape(-1).float()
+                    certainty_sum = (
+                        certainty_sum + torch.maximum(probs, 1 - probs).sum()
+                    )
+                    n_objects += probs.shape[0]
 
-        y_all_pred = y_all_pred.numpy().reshape([-1, 1])
-        y_all_pred_prob = y_all_pred_prob.numpy().reshape([-1, 1])
-        y_all_true = y_all_true.numpy().reshape([-1, 1])
+        mean_loss = (losses / n_batches).item()
 
-        metrics = self.estimator.estimate(y_all_true, y_all_pred, y_all_pred_prob)
+        if self.multiclass:
+            y_all_pred = torch.cat(preds_list, dim=0).cpu().numpy().reshape([-1, 1])
+            y_all_pred_prob = (
+                torch.cat(preds_prob_list, dim=0).cpu().numpy().reshape([-1, 1])
+            )
+            y_all_true = torch.cat(trues_list, dim=0).cpu().numpy().reshape([-1, 1])
+            metrics = self.estimator.estimate(y_all_true, y_all_pred, y_all_pred_prob)
+        else:
+            certainty = (certainty_sum / n_objects).item()
+            metrics = self.estimator.estimate_from_cm(
+                cm.reshape(2, 2).cpu().numpy(), certainty
+            )
 
         metrics = [mean_loss] + metrics
         return metrics
 
     def save_metrics_as_csv(self, path: str) -> None:
-        res = pd.DataFrame([])
+        frames = []
         for split, metrics in self.dict_logging.items():
             df_metrics = pd.DataFrame(metrics)
             df_metrics["epoch"] = np.arange(1, len(df_metrics) + 1)
             df_metrics["split"] = split
-            res = pd.concat([res, df_metrics])
+            frames.append(df_metrics)
 
-        res = res.round(4)
+        res = pd.concat(frames, copy=False).round(4)
         res.to_csv(path, index=False)
 
     def save_result(self, save_path: str, model_name: str) -> None:
+        # under a distributed launch every rank holds identical weights and
+        # metrics; only rank 0 should write them
+        if not is_main_process():
+            return
+
         if not os.path.isdir(save_path):
             os.makedirs(save_path)
 
         full_path = save_path + "/" + model_name
-        torch.save(self.model.state_dict(), full_path + ".pt")
+        torch.save(self.base_model.state_dict(), full_path + ".pt")
 
         self.save_metrics_as_csv(full_path + "_metrics.csv")
 
@@ -359,6 +474,9 @@ class DiscTrainer(Trainer):
         device: str = "cpu",
         multiclass: bool = False,
         train_self_supervised: bool = False,
+        compile_model: bool = False,
+        use_amp: bool = False,
+        bf16: bool = False,
     ) -> None:
         super().__init__(
             model=model,
@@ -372,10 +490,14 @@ class DiscTrainer(Trainer):
             device=device,
             multiclass=multiclass,
             train_self_supervised=train_self_supervised,
+            compile_model=compile_model,
+            use_amp=use_amp,
+            bf16=bf16,
         )
 
         self.attack = attack
         self.attack_scheduler = attack_scheduler
+        self._adv_cache = dict()
 
     @staticmethod
     def initialize_with_params(
@@ -399,6 +521,9 @@ class DiscTrainer(Trainer):
         seed: int = 0,
         multiclass: bool = False,
         train_self_supervised: bool = False,
+        compile_model: bool = False,
+        use_amp: bool = False,
+        bf16: bool = False,
     ):
         fix_seed(seed)
         if model_params == "None" or not model_params:
@@ -411,6 +536,7 @@ class DiscTrainer(Trainer):
             scheduler_params = {}
 
         model = get_model(model_name, model_params, device=device)
+        model = wrap_distributed(model, device)
         criterion = get_criterion(criterion_name, criterion_params)
         optimizer = get_optimizer(optimizer_name, model.parameters(), optimizer_params)
         scheduler = get_scheduler(scheduler_name, optimizer, scheduler_params)
@@ -434,6 +560,9 @@ class DiscTrainer(Trainer):
             device=device,
             multiclass=multiclass,
             train_self_supervised=train_self_supervised,
+            compile_model=compile_model,
+            use_amp=use_amp,
+            bf16=bf16,
         )
 
     @staticmethod
@@ -443,10 +572,14 @@ class DiscTrainer(Trainer):
         optuna_params: Dict,
         const_params: Dict,
     ):
+        if "pruner" in optuna_params:
+            pruner = instantiate(optuna_params["pruner"])
+        else:
+            pruner = optuna.pruners.HyperbandPruner(min_resource=1, reduction_factor=3)
         study = optuna.create_study(
             direction="maximize",
             sampler=instantiate(optuna_params["sampler"]),
-            pruner=instantiate(optuna_params["pruner"]),
+            pruner=pruner,
         )
         study.optimize(
             partial(
@@ -485,14 +618,37 @@ class DiscTrainer(Trainer):
         )
 
         model = DiscTrainer.initialize_with_params(**initial_model_parameters)
-        last_epoch_metrics = model.train_model(train_loader, valid_loader)
-        return last_epoch_metrics[optim_metric]
+        last_epoch_metrics = model.train_model(
+            train_loader, valid_loader, trial=trial, optim_metric=optim_metric
+        )
+        return last_epoch_metrics[model.metric_names.index(optim_metric)]
+
+    def _attack_cache_key(self) -> Tuple:
+        return (id(self.attack), self.attack.eps, self.attack.n_steps)
+
+    def _get_adversarial_loaders(
+        self, train_loader: DataLoader, valid_loader: DataLoader, transform=None
+    ) -> Tuple[DataLoader]:
+        key = self._attack_cache_key()
+        if key not in self._adv_cache:
+            # single-entry cache: the scheduler only ever moves eps forward,
+            # so stale loaders (and their datasets) would otherwise pile up
+            # for the rest of the run
+            self._adv_cache.clear()
+            self._adv_cache[key] = (
+                self._generate_adversarial_data(train_loader, transform),
+                self._generate_adversarial_data(valid_loader),
+            )
+        return self._adv_cache[key]
 
     def _generate_adversarial_data(
         self, loader: DataLoader, transform=None
     ) -> DataLoader:
-        X_orig = torch.tensor(loader.dataset.X)
-        X_adv = self.attack.apply_attack(loader).squeeze(-1)
+        # zero-copy view: X_orig is only read by the concat below, so no
+        # defensive clone of the whole dataset is needed
+        X_orig = torch.as_tensor(loader.dataset.X)
+        X_adv = self.attack.apply_attack(loader)
+        X_adv.squeeze_(-1)
 
         assert X_orig.shape == X_adv.shape
 
@@ -505,24 +661,35 @@ class DiscTrainer(Trainer):
         dataset_class = loader.dataset.__class__
         dataset = dataset_class(new_x, new_y, transform)
 
-        loader = DataLoader(dataset, batch_size=loader.batch_size, shuffle=True)
+        # pinned host memory lets the non_blocking copies in _run_epoch
+        # overlap with the previous batch's compute; the dataset is fully
+        # in memory, so worker processes would only add IPC overhead
+        loader = DataLoader(
+            dataset,
+            batch_size=loader.batch_size,
+            shuffle=True,
+            pin_memory="cuda" in str(self.device),
+        )
 
         return loader
 
     def train_model(
-        self, train_loader: DataLoader, valid_loader: DataLoader, transform
+        self,
+        train_loader: DataLoader,
+        valid_loader: DataLoader,
+        transform=None,
+        trial: Trial = None,
+        optim_metric: str = None,
     ) -> Dict[str, float]:
-        if self.model.self_supervised and self.train_self_supervised:
-            print("Training self-supervised model")
-            X_train = train_loader.dataset.X.unsqueeze(-1).numpy()
-            self.model.train_embedding(X_train, verbose=True)
-            print("Training self-supervised part is finished")
+        if self.base_model.self_supervised and self.train_self_supervised:
+            self._train_self_supervised(train_loader)
 
         if self.early_stop_patience and self.early_stop_patience != "None":
             earl_stopper = EarlyStopper(self.early_stop_patience)
 
-        adv_train_loader = self._generate_adversarial_data(train_loader, transform)
-        adv_valid_loader = self._generate_adversarial_data(valid_loader)
+        adv_train_loader, adv_valid_loader = self._get_adversarial_loaders(
+            train_loader, valid_loader, transform
+        )
         cur_eps = self.attack.eps
 
         self._init_logging(["loss"] + self.estimator.get_metrics_names() + ["eps"])
@@ -535,6 +702,7 @@ class DiscTrainer(Trainer):
             test_metrics_epoch = list(test_metrics_epoch) + [cur_eps]
 
             self._logging(train_metrics_epoch, test_metrics_epoch, epoch)
+            self._report_to_trial(trial, optim_metric, test_metrics_epoch, epoch)
 
             if self.early_stop_patience and self.early_stop_patience != "None":
                 res_early_stop = earl_stopper.early_stop(test_metrics_epoch[0])
@@ -550,9 +718,8 @@ class DiscTrainer(Trainer):
                 if cur_eps != self.attack.eps and epoch + 1 != self.n_epochs:
                     cur_eps = self.attack.eps
                     print("----- New epsilon", round(cur_eps, 3))
-                    adv_train_loader = self._generate_adversarial_data(
-                        train_loader, transform
+                    adv_train_loader, adv_valid_loader = self._get_adversarial_loaders(
+                        train_loader, valid_loader, transform
                     )
-                    adv_valid_loader = self._generate_adversarial_data(valid_loader)
 
         return test_metrics_epoch
@@ -92,28 +92,33 @@ def get_optuna_param_for_type(
     return initial_model_parameters, trial
 
 
-def update_one_param(
-    new_param_name: str, new_param_value: Any, final_params: Dict
-) -> Dict:
-    for def_param_name, def_param_value in final_params.items():
-        if isinstance(def_param_value, dict):
-            final_params[def_param_name] = update_one_param(
-                new_param_name, new_param_value, def_param_value
-            )
-        else:
-            if new_param_name == def_param_name:
-                final_params[new_param_name] = new_param_value
-                # final_params.update({best_param_name: best_param_value})
-    return final_params
+def collect_param_paths(params: Dict) -> Dict:
+    # one iterative walk mapping every leaf parameter name to the key paths
+    # it occurs at, so lookups do not rescan the whole tree per parameter
+    param_paths = {}
+    stack = [((), params)]
+    while stack:
+        prefix, node = stack.pop()
+        for param_name, param_value in node.items():
+            if isinstance(param_value, dict):
+                stack.append((prefix + (param_name,), param_value))
+            else:
+                param_paths.setdefault(param_name, []).append(
+                    prefix + (param_name,)
+                )
+    return param_paths
 
 
 def update_dict_params(original_params: Dict, new_params: Dict) -> Dict:
     final_params = copy.deepcopy(original_params)
+    param_paths = collect_param_paths(final_params)
     for new_param_name, new_param_value in new_params.items():
-        final_best_params = update_one_param(
-            new_param_name, new_param_value, final_params
-        )
-    return final_best_params
+        for path in param_paths.get(new_param_name, ()):
+            node = final_params
+            for key in path[:-1]:
+                node = node[key]
+            node[path[-1]] = new_param_value
+    return final_params
 
 
 def update_params_with_attack_params(params: Dict, new_params: Dict) -> Dict:
@@ -168,8 +173,8 @@ def get_optimization_dict(params_vary: DictConfig, trial: Trial) -> Mapping[str,
 
 
 def build_dataframe_metrics(experiment):
-    df = pd.DataFrame()
     metrics_dict = experiment.dict_logging
+    frames = []
     for split in metrics_dict.keys():
         df_loc = pd.DataFrame([])
 
@@ -180,8 +185,9 @@ def build_dataframe_metrics(experiment):
         df_loc["iter"] = np.arange(1, len(df_loc) + 1)
 
         df_loc = df_loc[["iter", "split"] + list(metrics_dict[split].keys())]
+        frames.append(df_loc)
 
-    df = pd.concat([df, df_loc])
+    df = pd.concat(frames, copy=False)
     return df
 
 
@@ -218,7 +224,7 @@ def save_train_classifier(model, save_path, model_name):
     torch.save(model.state_dict(), full_path)
 
 
-def fix_seed(seed: int) -> None:
+def fix_seed(seed: int, strict_deterministic: bool = False) -> None:
     # Set Python random seed
     random.seed(seed)
 
@@ -230,8 +236,14 @@ def fix_seed(seed: int) -> None:
     torch.cuda.manual_seed(seed)
     torch.cuda.manual_seed_all(seed)
 
-    # Set deterministic behavior for cudnn
-    torch.backends.cudnn.deterministic = True
+    # Deterministic cudnn kernels disable the autotuner and are noticeably
+    # slower, so only ask for them when strict reproducibility is required
+    if strict_deterministic:
+        torch.backends.cudnn.deterministic = True
+        torch.backends.cudnn.benchmark = False
+    else:
+        torch.backends.cudnn.deterministic = False
+        torch.backends.cudnn.benchmark = True
 
 
 def calc_stats(data):